@@ -1,39 +1,97 @@
 import re
 import json
 import hashlib
+import mmap
+import multiprocessing
 import os
 from datetime import datetime
 
+try:
+    import orjson  # Optional: Rust-backed encoder for the export step
+except ImportError:
+    orjson = None
+
 # --- CONFIGURATION ---
 INPUT_FILE = "./data/raw_property.csv"
 OUTPUT_FILE = "./output/rwa_assets.json"
 CURRENT_YEAR = 2026
 MIN_EC_AGE = 10  # Foreigners cannot buy ECs younger than 10 years
+PARSE_CHUNKSIZE = 1024  # Rows per worker task (amortizes IPC pickling)
+DATA_SOURCE = "URA_API_2026"
+EST_VALUATION = "Dynamic (AMM)"  # Priced by the AMM, not a fixed appraisal
 
 # --- SCORING WEIGHTS (For AI Insights) ---
 # We penalize distance from CBD and MRT to create a "Connectivity Score"
 WEIGHT_MRT = 0.6
 WEIGHT_CBD = 0.4
 
+# --- REGEX ANCHORS (compiled once, reused for every row) ---
+_YIELD_RE = re.compile(r"(\d{1,2}\.\d{1,2})%")
+_AREA_RE = re.compile(r"(\d{3,5}-\d{3,5}|>3000|<1000)")
+_DIST_RE = re.compile(r"^(\d{1,2})")
+_TENURE_RE = re.compile(r"(Freehold|999 yrs.*?|99 yrs.*?)(\d{4})?$", re.IGNORECASE)
+_YEAR_RE = re.compile(r"from (\d{4})")
+_FLOAT_RE = re.compile(r"(\d+\.?\d*)")
+# Master anchor: [Name][Bed][Area][District]...[Yield]% in a single pass
+_MASTER_RE = re.compile(
+    r"(?P<name>.*?)(?P<area>\d{3,5}-\d{3,5}|>3000|<1000)(?P<district>\d{1,2})?"
+    r".*?(?P<yield>\d{1,2}\.\d{1,2})%"
+)
+
+# --- TRUST ANCHOR ---
+# Initialised SHA-256 state; copying it skips algorithm lookup per row
+_SHA256_PROTO = hashlib.sha256()
+
 def calculate_connectivity_score(mrt_m, cbd_km):
     """
     Generates a 0-100 Score for location quality.
     - MRT < 500m is excellent.
     - CBD < 5km is excellent.
     """
-    try:
-        if mrt_m is None or cbd_km is None: return 0
-        
-        # Normalize: 100 points - (deductions for distance)
-        # Deduct 1 point for every 50m from MRT
-        mrt_penalty = max(0, (mrt_m - 200) / 50) 
-        # Deduct 2 points for every 1km from CBD
-        cbd_penalty = max(0, (cbd_km * 2))
-        
-        score = 100 - (mrt_penalty * WEIGHT_MRT) - (cbd_penalty * WEIGHT_CBD)
-        return round(max(0, min(100, score)), 1)
-    except:
-        return 0
+    if mrt_m is None or cbd_km is None: return 0
+    
+    # Normalize: 100 points - (deductions for distance)
+    # Deduct 1 point for every 50m from MRT
+    mrt_penalty = max(0, (mrt_m - 200) / 50) 
+    # Deduct 2 points for every 1km from CBD
+    cbd_penalty = max(0, (cbd_km * 2))
+    
+    score = 100 - (mrt_penalty * WEIGHT_MRT) - (cbd_penalty * WEIGHT_CBD)
+    return round(max(0, min(100, score)), 1)
+
+def calculate_risk_score(is_leasehold, connectivity_score, yield_apy):
+    """
+    Pure arithmetic core of the risk model (scalars in, int out).
+    Starts from a base score of 10 and deducts for weak fundamentals.
+    """
+    risk_score = 10
+    
+    # Deduct for Leasehold
+    if is_leasehold: risk_score -= 2
+    # Deduct for low connectivity
+    if connectivity_score < 50: risk_score -= 2
+    # Deduct for very low yield
+    if yield_apy < 2.0: risk_score -= 1
+    
+    return risk_score
+
+def hash_row(raw_bytes):
+    """SHA-256 hex digest of a raw row (the on-chain data proof)."""
+    h = _SHA256_PROTO.copy()
+    h.update(raw_bytes)
+    return h.hexdigest()
+
+def _is_leftmost_yield(text, master):
+    """
+    True when the master match landed on the same yield the anchors would
+    pick (the leftmost "xx.xx%"), so its identity groups can be trusted.
+    """
+    yield_start = master.start('yield')
+    # Every yield ends in '%', so the leftmost one must end at the first '%'
+    if text.find('%') != master.end() - 1:
+        return False
+    # A 1-digit yield preceded by a digit means the anchor would take 2 digits
+    return not (yield_start and text[yield_start - 1].isdigit() and text[yield_start + 1] == '.')
 
 def smart_parse_row(row):
     """
@@ -43,20 +101,43 @@ def smart_parse_row(row):
     text = row.strip()
     
     # ---------------------------------------------------------
-    # ANCHOR 1: THE YIELD (%) - This is our 'Center Point'
+    # FAST PATH: MASTER ANCHOR (Name, Bed, Area, District, Yield)
     # ---------------------------------------------------------
-    # We look for something like "1.97%" or "4.52%"
-    # We split the string into LEFT (Identity) and RIGHT (Location/Tenure)
-    yield_match = re.search(r"(\d{1,2}\.\d{1,2})%", text)
-    
-    if not yield_match:
-        return None # Garbage row
+    # One engine pass resolves the whole LEFT side and the yield.
+    master = _MASTER_RE.match(text)
+    if master and _is_leftmost_yield(text, master):
+        yield_value = master.group('yield')
+        split_index = master.start('yield')
+        end_index = master.end()
+        raw_name_part, area, district = master.group('name', 'area', 'district')
+    else:
+        # ---------------------------------------------------------
+        # ANCHOR 1: THE YIELD (%) - This is our 'Center Point'
+        # ---------------------------------------------------------
+        # We look for something like "1.97%" or "4.52%"
+        # We split the string into LEFT (Identity) and RIGHT (Location/Tenure)
+        yield_match = _YIELD_RE.search(text)
         
-    data['yield_apy'] = float(yield_match.group(1))
-    
-    # Split the text based on the yield
-    split_index = yield_match.start()
-    end_index = yield_match.end()
+        if not yield_match:
+            return None # Garbage row
+        
+        yield_value = yield_match.group(1)
+        split_index = yield_match.start()
+        end_index = yield_match.end()
+        
+        # Logic: Look for the Area Range (e.g., 2000-2500) as the separator
+        left_side = text[:split_index]
+        area_match = _AREA_RE.search(left_side)
+        if area_match:
+            area = area_match.group(1)
+            raw_name_part = left_side[:area_match.start()]
+            # We assume the digits immediately following area are [District][Sold]
+            district_match = _DIST_RE.match(left_side[area_match.end():])
+            district = district_match.group(1) if district_match else None
+        else:
+            area = None
+        
+    data['yield_apy'] = float(yield_value)
     
     left_side = text[:split_index]  # Name, Bed, Area, District...
     right_side = text[end_index:]   # Rented, Rent, MRT, Tenure...
@@ -66,14 +147,9 @@ def smart_parse_row(row):
     # ---------------------------------------------------------
     # Structure: [Name] [Bed] [Area Range] [District] ...
     
-    # 1. Project Name & Bed/Area
-    # Logic: Look for the Area Range (e.g., 2000-2500) as the separator
-    area_match = re.search(r"(\d{3,5}-\d{3,5}|>3000|<1000)", left_side)
-    
-    if area_match:
-        data['area_sqft_range'] = area_match.group(1)
+    if area:
+        data['area_sqft_range'] = area
         # Name is everything before area, minus the 'BedRm' digit/n.a.
-        raw_name_part = left_side[:area_match.start()]
         
         # Extract BedRm (last part of name section)
         if raw_name_part.endswith("n.a."):
@@ -86,17 +162,16 @@ def smart_parse_row(row):
             data['bedrooms'] = "?"
             data['project_name'] = raw_name_part.strip()
             
-        # Extract District (Usually 1-2 digits right after Area)
-        # We assume the digits immediately following area are [District][Sold]
+        # District: usually 1-2 digits right after Area
         # This is fuzzy, but works for Insights
-        remaining_left = left_side[area_match.end():]
-        district_match = re.match(r"^(\d{1,2})", remaining_left)
-        data['district'] = district_match.group(1) if district_match else "Unknown"
+        data['district'] = district or "Unknown"
         
     else:
         # Fallback if area is weird
         data['project_name'] = left_side[:20] + "..."
         data['area_sqft_range'] = "Unknown"
+        data['bedrooms'] = "?"
+        data['district'] = "?"
 
     # ---------------------------------------------------------
     # PARSING RIGHT SIDE (Location & Tenure)
@@ -104,12 +179,12 @@ def smart_parse_row(row):
     # Structure: ... [MRT] [CBD] [Tenure Commencing...]
     
     # 1. Tenure (At the very end)
-    tenure_match = re.search(r"(Freehold|999 yrs.*?|99 yrs.*?)(\d{4})?$", right_side, re.IGNORECASE)
+    tenure_match = _TENURE_RE.search(right_side)
     if tenure_match:
         data['tenure_raw'] = tenure_match.group(0).strip()
         data['tenure_type'] = "Freehold/999yr" if ("Freehold" in data['tenure_raw'] or "999" in data['tenure_raw']) else "Leasehold"
         # Year
-        year_match = re.search(r"from (\d{4})", data['tenure_raw'])
+        year_match = _YEAR_RE.search(data['tenure_raw'])
         data['commence_year'] = int(year_match.group(1)) if year_match else 0
         
         # Remove Tenure from right_side to find MRT/CBD
@@ -121,7 +196,7 @@ def smart_parse_row(row):
     # 2. MRT & CBD (Extract numbers from the end of the remaining string)
     # The last two numbers in 'loc_text' are likely CBD(km) and MRT(m)
     # Regex to find all floating point numbers
-    floats = re.findall(r"(\d+\.?\d*)", loc_text)
+    floats = _FLOAT_RE.findall(loc_text)
     
     if len(floats) >= 2:
         # CBD is usually the last number (km, e.g. 10.8)
@@ -139,8 +214,8 @@ def smart_parse_row(row):
     # ---------------------------------------------------------
     # AI ENRICHMENT (The "Insightful" Part)
     # ---------------------------------------------------------
-    data['connectivity_score'] = calculate_connectivity_score(data.get('mrt_dist_m'), data.get('cbd_dist_km'))
-    data['data_hash'] = hashlib.sha256(row.encode()).hexdigest()
+    data['connectivity_score'] = calculate_connectivity_score(data['mrt_dist_m'], data['cbd_dist_km'])
+    data['data_hash'] = hash_row(row.encode())
     
     return data
 
@@ -169,15 +244,11 @@ def check_compliance_and_risk(asset):
             reason = "Unknown Lease Year"
 
     # 2. RISK SCORING (For Investors)
-    # Start with base score 10
-    risk_score = 10
-    
-    # Deduct for Leasehold
-    if asset['tenure_type'] == "Leasehold": risk_score -= 2
-    # Deduct for low connectivity
-    if asset['connectivity_score'] < 50: risk_score -= 2
-    # Deduct for very low yield
-    if asset['yield_apy'] < 2.0: risk_score -= 1
+    risk_score = calculate_risk_score(
+        asset['tenure_type'] == "Leasehold",
+        asset['connectivity_score'],
+        asset['yield_apy']
+    )
     
     # Map to Tier
     risk_tier = "A (Low Risk)"
@@ -191,64 +262,124 @@ def check_compliance_and_risk(asset):
         "score": risk_score
     }
 
+def decode_row(raw_line):
+    """
+    Decodes one raw CSV line, normalising CRLF endings the way text mode
+    would so the row hash stays the same on Windows-exported files.
+    """
+    if raw_line.endswith(b"\r\n"):
+        raw_line = raw_line[:-2] + b"\n"
+    return raw_line.decode('utf-8', 'ignore')
+
+def process_row(raw_line):
+    """
+    Full per-row pipeline: decode -> parse -> compliance gate.
+    Returns the flat field tuple of an approved asset, or None.
+    (Top-level so it can be shipped to worker processes.)
+    """
+    if len(raw_line) < 10: return None
+    
+    parsed = smart_parse_row(decode_row(raw_line))
+    if not parsed: return None
+    
+    compliance = check_compliance_and_risk(parsed)
+    
+    # Only include Approved assets in the Oracle Feed
+    if compliance['status'] != "APPROVED": return None
+    
+    return (
+        parsed['data_hash'],
+        parsed['project_name'],
+        parsed['bedrooms'],
+        parsed['area_sqft_range'],
+        parsed['district'],
+        parsed['yield_apy'],
+        parsed['connectivity_score'],
+        compliance['risk_tier'],
+        compliance['reason'],
+        parsed['mrt_dist_m']
+    )
+
+def build_asset_record(data_hash, project, bedrooms, area, district, yield_apy,
+                       connectivity_score, risk_tier, compliance_note, mrt_dist_m):
+    """
+    Nests one row of the columnar feed into the FINAL ORACLE PAYLOAD
+    (this goes to the Frontend/Chain).
+    """
+    ticker_stem = project[:3].upper()
+    return {
+        "id": data_hash[:12],
+        "identity": {
+            "project": project,
+            "type": f"{bedrooms}-Bed | {area} sqft",
+            "district": f"D{district}"
+        },
+        "financials": {
+            "yield_apy": yield_apy,
+            "est_valuation_sgd": EST_VALUATION,
+            # Oracle price for the Dynamic valuation, precomputed so mint_assets.py
+            # doesn't re-derive it: (1.5M SGD - 50k per yield point) in drops
+            "price_value_drops": int((1500000 - (yield_apy * 50000)) * 1000000),
+            "tokens": {
+                "pt_ticker": f"PT-{ticker_stem}",
+                "yt_ticker": f"YT-{ticker_stem}-28"
+            }
+        },
+        "insights": {
+            "connectivity_score": connectivity_score,
+            "risk_rating": risk_tier,
+            "compliance_note": compliance_note,
+            "mrt_distance": f"{int(mrt_dist_m)}m"
+        },
+        "proof": {
+            "source": DATA_SOURCE,
+            "data_hash": data_hash
+        }
+    }
+
 def main():
     print(f"🏗️  RWAX Data Pipeline Initialized...")
     
     raw_rows = []
     try:
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            raw_rows = f.readlines()
+        with open(INPUT_FILE, 'rb') as f:
+            # Map the file instead of reading it through the text layer;
+            # lines stay raw bytes until they pass the length filter
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw_rows = list(iter(mm.readline, b''))
     except FileNotFoundError:
         print("❌ Error: No data file found.")
         return
 
-    processed_assets = []
-    
     print(f"📊 Analyzing {len(raw_rows)} properties using Anchor Parsing...")
     
-    for row in raw_rows:
-        if len(row) < 10: continue
-        
-        parsed = smart_parse_row(row)
-        if parsed:
-            compliance = check_compliance_and_risk(parsed)
-            
-            # Only include Approved assets in the Oracle Feed
-            if compliance['status'] == "APPROVED":
-                
-                # FINAL ORACLE PAYLOAD (This goes to the Frontend/Chain)
-                asset_record = {
-                    "id": parsed['data_hash'][:12],
-                    "identity": {
-                        "project": parsed['project_name'],
-                        "type": f"{parsed.get('bedrooms', '?')}-Bed | {parsed.get('area_sqft_range', '?')} sqft",
-                        "district": f"D{parsed.get('district', '?')}"
-                    },
-                    "financials": {
-                        "yield_apy": parsed['yield_apy'],
-                        "est_valuation_sgd": "Dynamic (AMM)", 
-                        "tokens": {
-                            "pt_ticker": f"PT-{parsed['project_name'][:3].upper()}",
-                            "yt_ticker": f"YT-{parsed['project_name'][:3].upper()}-28"
-                        }
-                    },
-                    "insights": {
-                        "connectivity_score": parsed['connectivity_score'],
-                        "risk_rating": compliance['risk_tier'],
-                        "compliance_note": compliance['reason'],
-                        "mrt_distance": f"{int(parsed.get('mrt_dist_m', 0))}m"
-                    },
-                    "proof": {
-                        "source": "URA_API_2026",
-                        "data_hash": parsed['data_hash']
-                    }
-                }
-                processed_assets.append(asset_record)
+    # Rows are independent, so fan the parsing out across all cores.
+    # 'fork' lets workers inherit the compiled regexes; imap (not
+    # imap_unordered) keeps the feed in file order so asset ids stay stable.
+    # Cheap reject first: a row without '%' has no yield anchor, so it is
+    # dropped with a memchr scan before paying for IPC or the regex engine
+    candidate_rows = (row for row in raw_rows if b'%' in row)
+    
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    with multiprocessing.get_context(start_method).Pool() as pool:
+        approved_rows = [
+            fields for fields in pool.imap(process_row, candidate_rows, chunksize=PARSE_CHUNKSIZE)
+            if fields
+        ]
+
+    processed_assets = [build_asset_record(*fields) for fields in approved_rows]
 
     # Export
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(processed_assets, f, indent=2)
+    # Serialize once and write in a single call; the json branch produces the
+    # same bytes as orjson (UTF-8, trailing newline)
+    if orjson:
+        payload = orjson.dumps(processed_assets, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(processed_assets, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    with open(OUTPUT_FILE, 'wb', buffering=1 << 20) as f:
+        f.write(payload)
 
     print(f"✅ Success! Generated {len(processed_assets)} RWA Assets with AI Insights.")
     print(f"💾 Output: {OUTPUT_FILE}")
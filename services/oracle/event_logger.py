@@ -8,146 +8,296 @@ This creates a real-time connection between frontend user actions and backend te
 perfect for demos where you want to show synchronized activity.
 """
 import json
+import queue
+import re
+import sys
+import threading
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from flask import Flask, request, jsonify
-from flask_cors import CORS
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.live import Live
 from rich.text import Text
 from rich.rule import Rule
 
+try:
+    import orjson  # Optional: faster request/response JSON
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
-CORS(app)  # Allow frontend to send requests
+
+# Allow frontend to send requests: fixed CORS headers, no per-request rule matching
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+}
 
 console = Console()
+# When stdout is a log file/pipe, skip Rich layout and write plain lines
+_IS_TTY = sys.stdout.isatty()
 PORT = 3001
 
-# Event history for tracking
-event_history = []
+# Event history for tracking (bounded: oldest events drop off)
+EVENT_HISTORY_LIMIT = 10000
+event_history = deque(maxlen=EVENT_HISTORY_LIMIT)
 
+# Events are rendered off the request thread, up to RENDER_BATCH per print
+_EVENT_Q = queue.Queue()
+RENDER_BATCH = 16
 
-def format_event(event_type: str, data: dict):
-    """Format an event for beautiful terminal display"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    
-    # Emoji mapping for different event types
-    emoji_map = {
-        'wallet_connect': '🔗',
-        'wallet_disconnect': '🔌',
-        'did_check': '🔍',
-        'did_mint': '✨',
-        'ocr_scan': '📄',
-        'document_parse': '🧠',
-        'document_upload': '📤',
-        'pdf_extraction_start': '📄',
-        'pdf_page_processing': '📃',
-        'pdf_extraction_complete': '✅',
-        'ocr_scan_start': '👁️',
-        'ocr_progress': '⏳',
-        'ocr_scan_complete': '✅',
-        'document_parsing_start': '🔍',
-        'swap_initiate': '💧',
-        'swap_complete': '✅',
-        'asset_view': '👁️',
-        'verification_modal_open': '🛡️',
-        'transaction_submit': '📝',
-        'verification_error': '❌',
-        'error': '❌',
-    }
+# Emoji mapping for different event types
+EMOJI_MAP = {
+    'wallet_connect': '🔗',
+    'wallet_disconnect': '🔌',
+    'did_check': '🔍',
+    'did_mint': '✨',
+    'ocr_scan': '📄',
+    'document_parse': '🧠',
+    'document_upload': '📤',
+    'pdf_extraction_start': '📄',
+    'pdf_page_processing': '📃',
+    'pdf_extraction_complete': '✅',
+    'ocr_scan_start': '👁️',
+    'ocr_progress': '⏳',
+    'ocr_scan_complete': '✅',
+    'document_parsing_start': '🔍',
+    'swap_initiate': '💧',
+    'swap_complete': '✅',
+    'asset_view': '👁️',
+    'verification_modal_open': '🛡️',
+    'transaction_submit': '📝',
+    'verification_error': '❌',
+    'error': '❌',
+}
+
+# Display titles precomputed per known event type ("ocr_scan" -> "Ocr Scan")
+_TITLE_CACHE = {k: k.replace('_', ' ').title() for k in EMOJI_MAP}
+_BORDER = {'error': 'red'}
+
+# camelCase -> spaced words for verification table keys ("fullName" -> "Full Name")
+_CAMEL_RE = re.compile(r'([A-Z])')
+
+def json_preview(value):
+    """First 100 chars of indented JSON for a nested value"""
+    if orjson:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()[:100]
+        except TypeError:  # Not orjson-serializable (e.g. >64-bit ints)
+            pass
+    return json.dumps(value, indent=2)[:100]
+
+
+def format_event(event_type: str, data: dict, now: datetime):
+    """Format an event (received at `now`) for beautiful terminal display"""
+    timestamp = now.strftime("%H:%M:%S")
     
-    emoji = emoji_map.get(event_type, '⚡')
+    emoji = EMOJI_MAP.get(event_type, '⚡')
+    title = _TITLE_CACHE.get(event_type) or event_type.replace('_', ' ').title()
     
     # Create formatted panel
-    event_title = f"{emoji} [{timestamp}] {event_type.replace('_', ' ').title()}"
-    
-    # Format data as key-value pairs
-    data_lines = []
-    for key, value in data.items():
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value, indent=2)[:100]  # Truncate long JSON
-        data_lines.append(f"[cyan]{key}:[/cyan] {value}")
+    event_title = f"{emoji} [{timestamp}] {title}"
     
-    data_text = "\n".join(data_lines)
+    # Format data as key-value pairs (nested JSON truncated to 100 chars)
+    data_text = "\n".join(
+        f"[cyan]{key}:[/cyan] {json_preview(value) if isinstance(value, (dict, list)) else value}"
+        for key, value in data.items()
+    )
     
     return Panel(
         f"[bold]{event_title}[/bold]\n\n{data_text}",
-        border_style="green" if event_type != 'error' else "red",
+        border_style=_BORDER.get(event_type, "green"),
         title=f"Frontend Event",
         title_align="left"
     )
 
 
+def format_event_followup(event_type: str, event_data: dict):
+    """Special one-line summary for specific events (None if not applicable)"""
+    if event_type == 'wallet_connect':
+        return f"[bold green]→[/bold green] Wallet connected: [cyan]{event_data.get('address', 'N/A')}[/cyan]"
+    elif event_type == 'did_mint':
+        return f"[bold green]→[/bold green] DID minted successfully: [cyan]{event_data.get('hash', 'N/A')}[/cyan]"
+    elif event_type == 'swap_initiate':
+        return f"[bold cyan]→[/bold cyan] AMM swap initiated for: [yellow]{event_data.get('asset', 'N/A')}[/yellow]"
+    elif event_type == 'document_upload':
+        return f"[bold cyan]→[/bold cyan] Document uploaded: [yellow]{event_data.get('fileName', 'N/A')}[/yellow] ([cyan]{event_data.get('fileSize', 'N/A')}[/cyan])"
+    elif event_type == 'pdf_extraction_start':
+        return f"[bold blue]→[/bold blue] Starting PDF extraction: [cyan]{event_data.get('fileName', 'N/A')}[/cyan]"
+    elif event_type == 'pdf_page_processing':
+        return f"[dim]   Processing page {event_data.get('page', '?')}/{event_data.get('totalPages', '?')}[/dim]"
+    elif event_type == 'pdf_extraction_complete':
+        return f"[bold green]→[/bold green] PDF extraction complete: [cyan]{event_data.get('textLength', 0):,}[/cyan] characters from [yellow]{event_data.get('pages', 0)}[/yellow] pages"
+    elif event_type == 'ocr_scan_start':
+        return f"[bold yellow]→[/bold yellow] Starting OCR scan: [cyan]{event_data.get('method', 'N/A')}[/cyan]"
+    elif event_type == 'ocr_progress':
+        return f"[dim]   OCR progress: {event_data.get('progress', 0)}%[/dim]"
+    elif event_type == 'ocr_scan_complete':
+        return f"[bold green]→[/bold green] OCR complete: [cyan]{event_data.get('textLength', 0):,}[/cyan] characters extracted ([yellow]{event_data.get('confidence', 0)}%[/yellow] confidence)"
+    elif event_type == 'document_parsing_start':
+        return f"[bold magenta]→[/bold magenta] Starting document parsing with [cyan]{len(event_data.get('patterns', []))}[/cyan] extraction patterns"
+    elif event_type == 'ocr_scan':
+        return f"[bold yellow]→[/bold yellow] OCR processing document: [cyan]{event_data.get('fileName', 'N/A')}[/cyan]"
+    elif event_type == 'verification_error':
+        return f"[bold red]→[/bold red] Verification error: [red]{event_data.get('error', 'Unknown error')}[/red]"
+    return None
+
+
+def format_verification(event_data: dict):
+    """Renderables for the DID verification block (rule, table, summary)"""
+    document_type = event_data['documentType']
+    extracted_data = event_data['extractedData']
+    did_hash = event_data['didHash']
+    
+    # Display extracted data in a table
+    table = Table(show_header=True, header_style="bold magenta", border_style="magenta")
+    table.add_column("Field", style="cyan", width=20)
+    table.add_column("Value", style="white", width=40)
+    
+    table.add_row("Document Type", document_type)
+    
+    if extracted_data:
+        for key, value in extracted_data.items():
+            if value and value != "Not Found":
+                # Format the key nicely
+                display_key = _CAMEL_RE.sub(r' \1', key).strip().title()
+                table.add_row(display_key, str(value))
+    
+    table.add_row("DID Hash", f"[green]{did_hash}[/green]")
+    table.add_row("Status", "[bold green]✓ Verified & Minted[/bold green]")
+    
+    return [
+        "\n",
+        Rule(f"[bold magenta]📄 DID VERIFICATION - Real-Time Extracted Data[/bold magenta]"),
+        f"[dim][{event_data['timestamp']}][/dim]",
+        table,
+        f"[bold green]✅[/bold green] DID successfully minted on XRPL Testnet",
+        f"[dim]Transaction Hash: {did_hash}[/dim]\n",
+        Rule("[dim]Verification Complete[/dim]\n"),
+    ]
+
+
+def render_event(event: dict):
+    """All renderables for one queued event, in display order"""
+    event_type, event_data = event['type'], event['data']
+    
+    renderables = format_verification(event_data) if event_type == 'did_verification_demo' else []
+    renderables.append(format_event(event_type, event_data, event['timestamp']))
+    
+    followup = format_event_followup(event_type, event_data)
+    if followup:
+        renderables.append(followup)
+    return renderables
+
+
+def _drain_worker():
+    """Background renderer: drains the queue and prints events in batches"""
+    while True:
+        batch = [_EVENT_Q.get()]
+        while len(batch) < RENDER_BATCH:
+            try:
+                batch.append(_EVENT_Q.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            if _IS_TTY:
+                # Each event renders on its own, so one bad event doesn't drop its batch
+                renderables = []
+                for event in batch:
+                    try:
+                        renderables += render_event(event)
+                    except Exception as e:
+                        renderables.append(f"[bold red]❌ Error rendering {event['type']} event:[/bold red] {e}")
+                console.print(Group(*renderables))
+            else:
+                sys.stdout.write("".join(
+                    f"[{event['timestamp']:%H:%M:%S}] {event['type']} {event['data']}\n" for event in batch
+                ))
+                sys.stdout.flush()
+        except Exception as e:
+            console.print(f"[bold red]❌ Error rendering events:[/bold red] {e}")
+
+
+threading.Thread(target=_drain_worker, name="event-renderer", daemon=True).start()
+
+
+def read_json():
+    """Parse the request body (orjson when available)"""
+    if orjson:
+        return orjson.loads(request.get_data())
+    return request.get_json()
+
+
+def json_response(payload: dict, status: int = 200):
+    """Serialize a JSON response (orjson when available)"""
+    if orjson:
+        return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+    response = jsonify(payload)
+    response.status_code = status
+    return response
+
+
+@app.before_request
+def handle_preflight():
+    """Answer CORS preflight requests directly with an empty 204"""
+    if request.method == 'OPTIONS':
+        return app.response_class(status=204)
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attach the constant CORS headers to every response"""
+    response.headers.update(CORS_HEADERS)
+    return response
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({"status": "ok", "service": "RWAX Event Logger"})
+    return json_response({"status": "ok", "service": "RWAX Event Logger"})
 
 
 @app.route('/event', methods=['POST'])
 def log_event():
     """Receive and log frontend events"""
     try:
-        data = request.get_json()
+        data = read_json()
         event_type = data.get('type', 'unknown')
         event_data = data.get('data', {})
         
-        # Add timestamp
-        event_data['_timestamp'] = datetime.now().isoformat()
-        
-        # Store in history
-        event_history.append({
+        # Add timestamp (one clock read shared by history and display)
+        now = datetime.now()
+        event_data['_timestamp'] = now.isoformat()
+        event = {
             'type': event_type,
             'data': event_data,
-            'timestamp': datetime.now()
-        })
+            'timestamp': now
+        }
         
-        # Display beautifully in terminal
-        panel = format_event(event_type, event_data)
-        console.print(panel)
+        # Store in history
+        event_history.append(event)
         
-        # Special handling for specific events
-        if event_type == 'wallet_connect':
-            console.print(f"[bold green]→[/bold green] Wallet connected: [cyan]{event_data.get('address', 'N/A')}[/cyan]")
-        elif event_type == 'did_mint':
-            console.print(f"[bold green]→[/bold green] DID minted successfully: [cyan]{event_data.get('hash', 'N/A')}[/cyan]")
-        elif event_type == 'swap_initiate':
-            console.print(f"[bold cyan]→[/bold cyan] AMM swap initiated for: [yellow]{event_data.get('asset', 'N/A')}[/yellow]")
-        elif event_type == 'document_upload':
-            console.print(f"[bold cyan]→[/bold cyan] Document uploaded: [yellow]{event_data.get('fileName', 'N/A')}[/yellow] ([cyan]{event_data.get('fileSize', 'N/A')}[/cyan])")
-        elif event_type == 'pdf_extraction_start':
-            console.print(f"[bold blue]→[/bold blue] Starting PDF extraction: [cyan]{event_data.get('fileName', 'N/A')}[/cyan]")
-        elif event_type == 'pdf_page_processing':
-            console.print(f"[dim]   Processing page {event_data.get('page', '?')}/{event_data.get('totalPages', '?')}[/dim]")
-        elif event_type == 'pdf_extraction_complete':
-            console.print(f"[bold green]→[/bold green] PDF extraction complete: [cyan]{event_data.get('textLength', 0):,}[/cyan] characters from [yellow]{event_data.get('pages', 0)}[/yellow] pages")
-        elif event_type == 'ocr_scan_start':
-            console.print(f"[bold yellow]→[/bold yellow] Starting OCR scan: [cyan]{event_data.get('method', 'N/A')}[/cyan]")
-        elif event_type == 'ocr_progress':
-            console.print(f"[dim]   OCR progress: {event_data.get('progress', 0)}%[/dim]")
-        elif event_type == 'ocr_scan_complete':
-            console.print(f"[bold green]→[/bold green] OCR complete: [cyan]{event_data.get('textLength', 0):,}[/cyan] characters extracted ([yellow]{event_data.get('confidence', 0)}%[/yellow] confidence)")
-        elif event_type == 'document_parsing_start':
-            console.print(f"[bold magenta]→[/bold magenta] Starting document parsing with [cyan]{len(event_data.get('patterns', []))}[/cyan] extraction patterns")
-        elif event_type == 'ocr_scan':
-            console.print(f"[bold yellow]→[/bold yellow] OCR processing document: [cyan]{event_data.get('fileName', 'N/A')}[/cyan]")
-        elif event_type == 'verification_error':
-            console.print(f"[bold red]→[/bold red] Verification error: [red]{event_data.get('error', 'Unknown error')}[/red]")
+        # Hand off to the renderer thread so the response never waits on Rich
+        _EVENT_Q.put(event)
         
-        return jsonify({"status": "logged", "event_type": event_type})
+        return json_response({"status": "logged", "event_type": event_type})
     
     except Exception as e:
         console.print(f"[bold red]❌ Error logging event:[/bold red] {e}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+        return json_response({"status": "error", "message": str(e)}, 500)
 
 
 @app.route('/events', methods=['GET'])
 def get_events():
     """Get event history (for debugging)"""
-    return jsonify({
+    return json_response({
         "total": len(event_history),
-        "events": event_history[-50:]  # Last 50 events
+        "events": list(islice(reversed(event_history), 50))[::-1]  # Last 50 events
     })
 
 
@@ -155,53 +305,25 @@ def get_events():
 def log_verification():
     """Demo endpoint: Log DID verification with extracted data"""
     try:
-        data = request.get_json()
+        data = read_json()
         
         # Extract verification data
         document_type = data.get('documentType', 'Unknown')
         extracted_data = data.get('extractedData', {})
         did_hash = data.get('didHash', 'N/A')
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Create a beautiful terminal display
-        console.print("\n")
-        console.rule(f"[bold magenta]📄 DID VERIFICATION - Real-Time Extracted Data[/bold magenta]")
-        console.print(f"[dim][{timestamp}][/dim]")
-        
-        # Display extracted data in a table
-        table = Table(show_header=True, header_style="bold magenta", border_style="magenta")
-        table.add_column("Field", style="cyan", width=20)
-        table.add_column("Value", style="white", width=40)
-        
-        table.add_row("Document Type", document_type)
-        
-        if extracted_data:
-            for key, value in extracted_data.items():
-                if value and value != "Not Found":
-                    # Format the key nicely
-                    display_key = ''.join(' ' + c if c.isupper() else c for c in key).strip().title()
-                    table.add_row(display_key, str(value))
-        
-        table.add_row("DID Hash", f"[green]{did_hash}[/green]")
-        table.add_row("Status", "[bold green]✓ Verified & Minted[/bold green]")
-        
-        console.print(table)
-        console.print(f"[bold green]✅[/bold green] DID successfully minted on XRPL Testnet")
-        console.print(f"[dim]Transaction Hash: {did_hash}[/dim]\n")
-        console.rule("[dim]Verification Complete[/dim]\n")
+        now = datetime.now()
         
-        # Also log as regular event
+        # Queue the verification block together with its regular event panel
         event_data = {
             'documentType': document_type,
             'extractedData': extracted_data,
             'didHash': did_hash,
-            'timestamp': timestamp
+            'timestamp': now.strftime("%H:%M:%S")
         }
         
-        panel = format_event('did_verification_demo', event_data)
-        console.print(panel)
+        _EVENT_Q.put({'type': 'did_verification_demo', 'data': event_data, 'timestamp': now})
         
-        return jsonify({
+        return json_response({
             "status": "logged",
             "message": "Verification data logged to terminal",
             "didHash": did_hash
@@ -209,7 +331,7 @@ def log_verification():
     
     except Exception as e:
         console.print(f"[bold red]❌ Error logging verification:[/bold red] {e}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+        return json_response({"status": "error", "message": str(e)}, 500)
 
 
 def print_banner():
@@ -229,5 +351,6 @@ def print_banner():
 
 
 if __name__ == '__main__':
+    # Development server; for production use the Gunicorn entrypoint in wsgi.py
     print_banner()
-    app.run(port=PORT, debug=False, host='0.0.0.0')
+    app.run(port=PORT, debug=False, host='0.0.0.0', threaded=True)
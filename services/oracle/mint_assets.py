@@ -4,50 +4,590 @@
 Professional Terminal Interface for RWAX Protocol Asset Minting
 Demonstrates 5 XRPL Standards with beautiful, readable output using Rich library.
 """
+import argparse
+import asyncio
+import functools
 import json
+import math
+import os
+import sys
 import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
+from decimal import Decimal
+from json import JSONDecodeError
+from itertools import islice
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.align import Align
-from xrpl.clients import JsonRpcClient
-from xrpl.wallet import generate_faucet_wallet
+from xrpl.asyncio.account import get_next_valid_seq_number
+from xrpl.asyncio.clients import AsyncWebsocketClient, XRPLRequestFailureException
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.asyncio.ledger import get_latest_validated_ledger_sequence
+from xrpl.asyncio.wallet import generate_faucet_wallet
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.currencies import IssuedCurrency, XRP
 from xrpl.models.transactions import (
     AccountSet,
     AMMCreate,
     OracleSet,
+    Payment,
 )
 from xrpl.models.transactions.account_set import AccountSetAsfFlag
-from xrpl.utils import str_to_hex
-from xrpl.transaction import submit_and_wait
+from xrpl.models.requests import AccountInfo, AMMInfo, ServerState, SubmitOnly, Tx
+from xrpl.utils import str_to_hex, xrp_to_drops
+from xrpl.wallet import Wallet
+from xrpl.asyncio.transaction import sign, XRPLReliableSubmissionException
 
-XRPL_RPC = "https://s.altnet.rippletest.net:51234"
+try:
+    import ijson  # Optional: stream just the assets being minted from DATA_FILE
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: Rust-backed encoder/decoder for the JSON files
+except ImportError:
+    orjson = None
+
+XRPL_WS = "wss://s.altnet.rippletest.net:51233"
 DATA_FILE = "./output/rwa_assets.json"
-client = JsonRpcClient(XRPL_RPC)
+WALLET_CACHE = "./output/issuer_wallet.json"  # Issuer seed reused across runs (testnet only)
+MINT_LIMIT = 3  # Number of assets minted per run (demo)
+IO_BUFFER = 1 << 20  # 1 MiB file buffer for the JSON registry
+
+
+# One persistent WebSocket for the whole run: requests are multiplexed by id
+# over it instead of each paying an HTTP POST. Opened and closed by run().
+client = AsyncWebsocketClient(XRPL_WS)
 console = Console()
+# When stdout is a log file/pipe, skip Rich spinners and live progress
+_IS_TTY = sys.stdout.isatty()
+POLL_INTERVAL = 1  # Seconds between validation polls for a submitted batch
+SUBMIT_CONCURRENCY = 16  # Max in-flight SubmitOnly requests per batch
+LEDGER_OFFSET = 20  # Ledgers a batch has to validate before it expires
+MAX_FEE = 2000000  # Fee ceiling in drops (2 XRP)
+BUSY_RETRIES = 4  # Retries (1s, 2s, 4s, 8s backoff) while the node reports overload
+BUSY_ERRORS = ("tooBusy", "slowDown")
+# Submit results that mean the node won't apply the transaction (malformed,
+# failed or not queued locally), leaving its Sequence unused
+REJECTED_RESULTS = ("tem", "tef", "tel")
+AMM_PROBE_RETRIES = 3  # AMMInfo attempts on transport errors (1s, 2s backoff between)
+AMM_NOT_FOUND_ERRORS = ("actNotFound", "ammNotFound", "entryNotFound")
+# A request the socket never answered (times out) or couldn't send
+TRANSPORT_ERRORS = (asyncio.TimeoutError, XRPLWebsocketException)
+# What a bad or unreadable DATA_FILE raises (orjson's error subclasses JSONDecodeError)
+ASSET_LOAD_ERRORS = (JSONDecodeError, UnicodeDecodeError, OSError) + ((ijson.JSONError,) if ijson else ())
+
+# Static banners for main(); markup is parsed once here, not on every print
+HEADER_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold cyan]🚀 RWAX PROTOCOL[/bold cyan]\n"
+        "[bold]5 XRPL Standards Implementation[/bold]\n\n"
+        "[green]✅[/green] XLS-39 (Clawback) - Compliance enforcement\n"
+        "[green]✅[/green] XLS-47 (Price Oracles) - On-chain valuation\n"
+        "[green]✅[/green] XLS-30 (AMM) - Instant liquidity pools\n"
+        "[green]✅[/green] XLS-40 (DID) - Identity verification\n"
+        "[green]✅[/green] XLS-33 (MPT) - Multi-purpose tokens"
+    ),
+    border_style="cyan",
+    title=Text.from_markup("[bold cyan]Asset Minting Pipeline[/bold cyan]")
+)
+COMPLETE_PANEL = Panel.fit(
+    Text.from_markup("[bold green]✅ PROTOCOL UPGRADE COMPLETE[/bold green]"),
+    border_style="green"
+)
+FOOTER_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold]Next Steps[/bold]\n\n"
+        "[cyan]1.[/cyan] Run [bold]yarn sync-data[/bold] to sync to frontend\n"
+        "[cyan]2.[/cyan] Check frontend for Oracle prices and AMM status\n"
+        "[cyan]3.[/cyan] Test swap functionality with DID-verified account"
+    ),
+    border_style="dim",
+    title=Text.from_markup("[dim]📋 Actions[/dim]")
+)
+# Summary table status cells, shared by every row
+CHECK = Text.from_markup("[green]✓[/green]")
+CROSS = Text.from_markup("[red]✗[/red]")
 
 # [XLS-39 Implementation] Clawback flag constant
 # asfAllowTrustLineClawback = 49 enables compliance enforcement
 CLAWBACK_FLAG = AccountSetAsfFlag.ASF_ALLOW_TRUSTLINE_CLAWBACK
+LSF_ALLOW_TRUSTLINE_CLAWBACK = 0x80000000  # The AccountRoot flag it sets (permanent once on)
+
+# SequenceAllocator per issuer address. Transactions are submitted
+# concurrently from the same account, so sequences are handed out locally
+# instead of letting each autofill fetch (and collide on) account_info.
+_sequences = {}
+
+# Network fees in drops, fetched once per run: "base" for ordinary
+# transactions and "amm_create" (one owner reserve) for AMMCreate.
+_fees = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _currency_hex(ticker):
+    """40-char hex currency code for a ticker longer than the 3-letter standard.
+    
+    Upper-cased: the XRPL models and binary codec reject lowercase hex codes.
+    """
+    return str_to_hex(ticker).upper().ljust(40, '0')
+
+
+class SequenceAllocator:
+    """
+    Hands out consecutive Sequence numbers for one account.
+    
+    The starting Sequence is fetched once; every later value is counted
+    locally. All submits run on the one event loop and next() never awaits,
+    so no lock is needed. `gap` is a handed-out Sequence that could not be
+    filled (see _fill_sequence_gaps); nothing after it can apply until it is.
+    """
+    
+    def __init__(self, sequence):
+        self.sequence = sequence
+        self.gap = None
+    
+    @classmethod
+    async def fetch(cls, address):
+        """Build an allocator starting at the account's next valid Sequence."""
+        return cls(await get_next_valid_seq_number(address, client))
+    
+    def next(self):
+        sequence = self.sequence
+        self.sequence += 1
+        return sequence
+    
+    def release(self, sequence):
+        """Take back the most recently issued Sequence if it was never used."""
+        if sequence == self.sequence - 1:
+            self.sequence = sequence
+
+
+async def prime_sequence(wallet):
+    """Fetch the account's next Sequence once so later submits can allocate locally."""
+    _sequences[wallet.classic_address] = await SequenceAllocator.fetch(wallet.classic_address)
+
+
+async def request_with_backoff(request):
+    """
+    client.request, retried with exponential backoff only while the node
+    answers tooBusy/slowDown. Any other response is returned as is.
+    """
+    for attempt in range(BUSY_RETRIES + 1):
+        response = await client.request(request)
+        if response.is_successful() or response.result.get('error') not in BUSY_ERRORS or attempt == BUSY_RETRIES:
+            return response
+        await asyncio.sleep(2 ** attempt)
+
+
+async def get_fees():
+    """
+    Fetch the open-ledger fee and the AMMCreate fee once, then serve them from _fees.
+    
+    Both come from a single server_state: the base fee scaled by the current
+    (or open-ledger escalation) load, capped at MAX_FEE like xrpl-py's
+    get_fee, and one owner reserve for AMMCreate.
+    """
+    if not _fees:
+        response = await client.request(ServerState())
+        if not response.is_successful():
+            raise XRPLRequestFailureException(response.result)
+        state = response.result['state']
+        load = max(state['load_factor'], state.get('load_factor_fee_escalation', 0)) / state['load_base']
+        _fees["base"] = str(min(math.ceil(state['validated_ledger']['base_fee'] * load), MAX_FEE))
+        _fees["amm_create"] = str(state['validated_ledger']['reserve_inc'])
+    return _fees
+
+
+async def submit_txs(txs, wallet):
+    """
+    Sign and submit several transactions from one wallet without waiting.
+    
+    Each transaction is stamped with the next local Sequence, the cached fee
+    and a LastLedgerSequence shared by the whole call, signed locally (no
+    per-transaction autofill round-trips), then sent with SubmitOnly
+    (returns as soon as the node queues it), at most SUBMIT_CONCURRENCY at a
+    time. A single background poller then checks every hash once per round
+    until each transaction is validated or the LastLedgerSequence has passed,
+    so N transactions cost roughly one ledger close instead of N.
+    
+    Returns one future per transaction, in order, resolving to the validated
+    Tx response or raising the exception describing why it failed.
+    
+    A transaction the node rejects on submission leaves its Sequence unused,
+    which would hold every later one as terPRE_SEQ; see _fill_sequence_gaps.
+    """
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in txs]
+    if wallet.classic_address not in _sequences:
+        # Wallet wasn't primed (e.g. a helper called standalone). Keep any
+        # allocator a concurrent call installed while this one was fetching.
+        allocator = await SequenceAllocator.fetch(wallet.classic_address)
+        _sequences.setdefault(wallet.classic_address, allocator)
+    fees, validated_ledger = await asyncio.gather(get_fees(), get_latest_validated_ledger_sequence(client))
+    last_ledger_sequence = validated_ledger + LEDGER_OFFSET
+    sequences = _sequences[wallet.classic_address]
+    if sequences.gap is not None:
+        # An earlier batch left a Sequence unused: retry filling it, or fail
+        # this batch now rather than queue it behind the gap until it expires
+        gap = await _fill_sequence_gaps(wallet, [sequences.gap], fees["base"], last_ledger_sequence)
+        if gap is not None:
+            for future in futures:
+                future.set_exception(XRPLReliableSubmissionException(f"Sequence {gap} is still unused"))
+            return futures
+        sequences.gap = None
+    signed = {}
+    sequence = None
+    for i, tx in enumerate(txs):
+        if sequence is None:
+            sequence = sequences.next()
+        try:
+            signed[i] = sign(replace(
+                tx,
+                sequence=sequence,
+                fee=fees["amm_create"] if isinstance(tx, AMMCreate) else fees["base"],
+                last_ledger_sequence=last_ledger_sequence
+            ), wallet)
+        except Exception as e:
+            futures[i].set_exception(e)  # Its Sequence goes to the next transaction instead
+            continue
+        sequence = None
+    if sequence is not None:
+        # Nothing was awaited since it was allocated, so an unused Sequence can be handed back
+        sequences.release(sequence)
+    
+    limit = asyncio.Semaphore(SUBMIT_CONCURRENCY)
+    
+    async def submit_one(tx):
+        async with limit:
+            return await request_with_backoff(SubmitOnly(tx_blob=tx.blob()))
+    
+    submissions = await asyncio.gather(
+        *(submit_one(tx) for tx in signed.values()),
+        return_exceptions=True
+    )
+    pending = {}
+    held = {}  # tx_hash: Sequence, for everything that made it to the node
+    unused = []
+    for (i, tx), response in zip(signed.items(), submissions):
+        if isinstance(response, Exception):
+            futures[i].set_exception(response)
+        elif not response.is_successful():
+            futures[i].set_exception(XRPLRequestFailureException(response.result))
+        elif response.result['engine_result'].startswith(REJECTED_RESULTS):
+            futures[i].set_exception(XRPLReliableSubmissionException(
+                f"{response.result['engine_result']}: {response.result['engine_result_message']}"
+            ))
+        else:
+            pending[tx.get_hash()] = futures[i]
+            held[tx.get_hash()] = tx.sequence
+            continue
+        unused.append(tx.sequence)
+    
+    if unused:
+        gap = await _fill_sequence_gaps(wallet, unused, fees["base"], last_ledger_sequence)
+        if gap is not None:
+            # Nothing after the gap can apply; fail it now instead of at LastLedgerSequence
+            for tx_hash, tx_sequence in held.items():
+                if tx_sequence > gap:
+                    pending.pop(tx_hash).set_exception(XRPLReliableSubmissionException(
+                        f"Sequence {gap} before it was never used"
+                    ))
+    
+    if pending:
+        poller = asyncio.create_task(_poll_validation(pending, last_ledger_sequence))
+        _pollers.add(poller)
+        poller.add_done_callback(_pollers.discard)
+    return futures
+
+
+async def _fill_sequence_gaps(wallet, sequences, fee, last_ledger_sequence):
+    """
+    Use up the given Sequence numbers (of transactions rejected on submission)
+    with no-op AccountSets, so the transactions after them can apply.
+    
+    The account's Sequence is re-fetched first: numbers below it were used
+    after all (e.g. a submit that timed out but reached the node). Returns
+    the first Sequence left unfilled, or None. An unfilled one is recorded
+    as the wallet allocator's gap for the next submit_txs call to retry;
+    the allocator itself never moves back, since the numbers below its
+    counter may already belong to a concurrent batch.
+    """
+    allocator = _sequences[wallet.classic_address]
+    try:
+        used = (await SequenceAllocator.fetch(wallet.classic_address)).sequence
+    except (*TRANSPORT_ERRORS, XRPLRequestFailureException):
+        allocator.gap = min(sequences)
+        return allocator.gap
+    for sequence in sorted(sequences):
+        if sequence < used:
+            continue
+        filler = sign(AccountSet(
+            account=wallet.classic_address,
+            sequence=sequence,
+            fee=fee,
+            last_ledger_sequence=last_ledger_sequence
+        ), wallet)
+        try:
+            response = await request_with_backoff(SubmitOnly(tx_blob=filler.blob()))
+        except TRANSPORT_ERRORS:
+            response = None
+        if response is None or not response.is_successful() or (
+            response.result['engine_result'].startswith(REJECTED_RESULTS)
+            and response.result['engine_result'] != "tefPAST_SEQ"  # Used up after all
+        ):
+            allocator.sequence = max(allocator.sequence, used)
+            allocator.gap = sequence
+            return sequence
+    return None
+
+
+# Strong references to running pollers so they aren't garbage-collected mid-flight
+_pollers = set()
+
+
+async def _poll_validation(pending, last_ledger_sequence):
+    """
+    Resolve each {tx_hash: future} once its transaction is validated or has expired.
+    
+    Transport and request failures are retried next round. Anything else
+    fails every future still pending, so waiters never hang on a dead poller.
+    """
+    try:
+        while pending:
+            await asyncio.sleep(POLL_INTERVAL)
+            try:
+                validated_ledger = await get_latest_validated_ledger_sequence(client)
+            except (*TRANSPORT_ERRORS, XRPLRequestFailureException):
+                continue
+            responses = await asyncio.gather(
+                *(client.request(Tx(transaction=tx_hash)) for tx_hash in pending),
+                return_exceptions=True
+            )
+            for (tx_hash, future), response in zip(list(pending.items()), responses):
+                # Transient errors and txnNotFound just mean "ask again next round"
+                if not isinstance(response, Exception) and response.is_successful() and response.result.get('validated'):
+                    code = response.result['meta']['TransactionResult']
+                    if code == "tesSUCCESS":
+                        future.set_result(response)
+                    else:
+                        future.set_exception(XRPLReliableSubmissionException(f"Transaction failed: {code}"))
+                    del pending[tx_hash]
+                elif validated_ledger >= last_ledger_sequence:
+                    future.set_exception(XRPLReliableSubmissionException(
+                        f"Not validated before LastLedgerSequence {last_ledger_sequence}"
+                    ))
+                    del pending[tx_hash]
+    except Exception as e:
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(e)
+
 
+async def submit_batch(txs, wallet):
+    """
+    Submit several transactions with submit_txs and wait for all of them.
+    
+    Returns one entry per transaction, in order: the validated Tx response,
+    or the exception describing why that transaction failed.
+    """
+    futures = await submit_txs(txs, wallet)
+    return await asyncio.gather(*futures, return_exceptions=True)
+
+
+async def submit_tx(tx, wallet):
+    """Submit a single transaction through submit_batch, raising if it fails."""
+    result, = await submit_batch([tx], wallet)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+async def flush_batch(batch, wallet):
+    """
+    Submit every queued (transaction, label) pair in one submit_batch call and
+    report each outcome. Empties the batch and returns {label: succeeded}.
+    """
+    results = await submit_batch([tx for tx, _ in batch], wallet)
+    outcomes = {}
+    for (tx, label), result in zip(batch, results):
+        if isinstance(result, Exception):
+            console.print(f"   [yellow]⚠️[/yellow] {label} failed: [dim]{str(result)[:50]}...[/dim]")
+            outcomes[label] = False
+        else:
+            console.print(f"   [green]✅[/green] [dim]{label} validated[/dim]")
+            outcomes[label] = True
+    batch.clear()
+    return outcomes
+
+
+def read_json(path):
+    """Parse a JSON file, using orjson when available."""
+    with open(path, 'rb', buffering=IO_BUFFER) as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json(path, data, indent=True):
+    """
+    Write data as JSON, 2-space indented or (indent=False) compact, using
+    orjson when available.
+    
+    The json fallback is byte-for-byte the same output (UTF-8, trailing
+    newline), so tracked files don't churn between environments. Either way
+    the document is serialized to bytes once and written in a single call.
+    """
+    if orjson:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        payload = orjson.dumps(data, option=option)
+    elif indent:
+        payload = (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    else:
+        payload = (json.dumps(data, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
+    with open(path, 'wb', buffering=IO_BUFFER) as f:
+        f.write(payload)
+
+
+def write_json_files(outputs):
+    """
+    Write each {path: (data, indent)} with write_json to a .tmp sibling, then
+    swap them in with os.replace, in the order given.
+    
+    Each file is replaced atomically (never left half-written), but a crash
+    between two replaces leaves the earlier files updated and the later ones
+    not, so callers put the file that records completion last.
+    """
+    for path, (data, indent) in outputs.items():
+        write_json(path + ".tmp", data, indent)
+    for path in outputs:
+        os.replace(path + ".tmp", path)
+
+
+def load_assets(limit):
+    """
+    Load the first `limit` assets from DATA_FILE.
+    
+    With ijson installed only those items are parsed, so startup cost and
+    memory don't grow with the size of the registry; otherwise the whole
+    file is parsed with read_json and sliced.
+    """
+    if ijson is not None:
+        with open(DATA_FILE, 'rb', buffering=IO_BUFFER) as f:
+            return list(islice(ijson.items(f, 'item', use_float=True), limit))
+    return read_json(DATA_FILE)[:limit]
+
+
+async def amm_exists(issuer_wallet, currency_code):
+    """
+    [XLS-30 Implementation] Check whether the token/XRP AMM pool already exists.
+    
+    "Not found" RPC errors mean there is no pool. Transport errors and an
+    overloaded node are retried with exponential backoff, so a network hiccup
+    doesn't turn into a doomed AMMCreate; any other RPC error raises
+    XRPLRequestFailureException.
+    """
+    request = AMMInfo(
+        asset=IssuedCurrency(currency=currency_code, issuer=issuer_wallet.classic_address),
+        asset2=XRP()
+    )
+    for attempt in range(AMM_PROBE_RETRIES):
+        try:
+            response = await request_with_backoff(request)
+        except TRANSPORT_ERRORS:
+            if attempt == AMM_PROBE_RETRIES - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+            continue
+        if response.is_successful():
+            return bool(response.result.get('amm'))
+        if response.result.get('error') in AMM_NOT_FOUND_ERRORS:
+            return False
+        raise XRPLRequestFailureException(response.result)
 
-def get_free_issuer_wallet():
+
+async def probe_pools(issuer_wallet, currency_codes):
+    """
+    Run every amm_exists probe concurrently and return two frozensets of
+    currency codes: those that already have a pool, and those whose probe
+    failed. Like create_amm_pool_for_token, callers skip the AMMCreate for a
+    failed probe rather than send one that may be doomed.
+    """
+    async def probe(currency_code):
+        try:
+            return currency_code, await amm_exists(issuer_wallet, currency_code)
+        except (*TRANSPORT_ERRORS, XRPLRequestFailureException) as e:
+            console.print(f"   [yellow]⚠️[/yellow] Pool check failed for {currency_code[:12]}...: [dim]{str(e)[:50]}...[/dim]")
+            return currency_code, None
+    
+    pools = dict(await asyncio.gather(*(probe(currency_code) for currency_code in currency_codes)))
+    return (
+        frozenset(currency_code for currency_code, exists in pools.items() if exists),
+        frozenset(currency_code for currency_code, exists in pools.items() if exists is None)
+    )
+
+
+def status(message, spinner="dots"):
+    """console.status spinner on a terminal; a no-op context when output is piped."""
+    return console.status(message, spinner=spinner) if _IS_TTY else nullcontext()
+
+
+@contextmanager
+def step(progress, description, spinner="dots"):
     """
-    Generate a new wallet from XRPL Testnet Faucet.
-    Returns wallet with funded account (1000 XRP on testnet).
+    Show one sub-step as a task on main()'s shared Progress, hidden again
+    once it finishes. Without a progress (helpers called standalone) this
+    falls back to a status spinner.
     """
+    if progress is None:
+        with status(description, spinner=spinner):
+            yield
+        return
+    task = progress.add_task(description, total=None)
+    try:
+        yield
+    finally:
+        progress.update(task, completed=1, total=1, visible=False)
+
+
+async def get_free_issuer_wallet(progress=None):
+    """
+    Load the issuer wallet cached in WALLET_CACHE, or generate a new one from
+    the XRPL Testnet Faucet (1000 XRP on testnet) and cache its seed.
+    
+    A cached wallet is only reused if its account still exists on the ledger
+    (testnet resets wipe it); that account_info lookup doubles as the
+    Sequence fetch, so reuse costs one round-trip instead of a faucet wait.
+    Waits are shown on `progress` when given (see step()).
+    
+    Returns (wallet, fresh); fresh is True for a new faucet account, which
+    cannot have any AMM pools yet.
+    """
+    try:
+        wallet = Wallet.from_seed(read_json(WALLET_CACHE)['seed'])
+        with step(progress, "[bold green]Checking cached issuer wallet..."):
+            await prime_sequence(wallet)
+        console.print(f"[bold green]✅[/bold green] Reusing issuer wallet: [cyan]{wallet.classic_address}[/cyan]")
+        return wallet, False
+    except (FileNotFoundError, JSONDecodeError, KeyError, ValueError, TypeError, AttributeError):  # No usable cached seed
+        pass
+    except XRPLRequestFailureException:
+        console.print("[bold yellow]⚠️[/bold yellow] [dim]Cached issuer account not found on ledger[/dim]")
+    
     console.print("[bold cyan]🔄[/bold cyan] Requesting issuer wallet from XRPL Testnet Faucet...")
     
-    with console.status("[bold green]Contacting faucet...", spinner="dots"):
-        wallet = generate_faucet_wallet(client, debug=False)
+    with step(progress, "[bold green]Contacting faucet..."):
+        wallet = await generate_faucet_wallet(client, debug=False)
+        await prime_sequence(wallet)
+    write_json(WALLET_CACHE, {"seed": wallet.seed, "address": wallet.classic_address})
     
     console.print(f"[bold green]✅[/bold green] Issuer wallet created: [cyan]{wallet.classic_address}[/cyan]")
-    return wallet
+    return wallet, True
 
 
-def configure_issuer(wallet):
+async def configure_issuer(wallet, progress=None):
     """
     [XLS-39 Implementation] Enable Clawback on Issuer Account
     
@@ -56,6 +596,10 @@ def configure_issuer(wallet):
     (e.g., blacklisting bad actors, regulatory enforcement).
     
     This is a critical compliance feature for regulated RWA tokenization.
+    
+    The flag can never be cleared, so the AccountSet (and its ledger close)
+    is skipped when WALLET_CACHE already records it for this wallet or
+    account_info shows it set; once enabled it is recorded in the cache.
     """
     console.print(Panel.fit(
         "[bold yellow]⚙️  Configuring Issuer Account[/bold yellow]\n"
@@ -63,12 +607,33 @@ def configure_issuer(wallet):
         border_style="yellow"
     ))
     
+    try:
+        cache = read_json(WALLET_CACHE)
+    except (FileNotFoundError, JSONDecodeError):
+        cache = {}
+    if cache.get('address') == wallet.classic_address and cache.get('clawback_enabled'):
+        console.print("[bold green]✅[/bold green] [green]Clawback already enabled[/green] [dim](cached)[/dim]")
+        return True
+    
     tx = AccountSet(account=wallet.classic_address, set_flag=CLAWBACK_FLAG)
     
-    with console.status("[bold yellow]Setting compliance flag...", spinner="dots2"):
+    with step(progress, "[bold yellow]Setting compliance flag...", spinner="dots2"):
         try:
-            submit_and_wait(tx, client, wallet)
-            console.print("[bold green]✅[/bold green] [green]Clawback enabled[/green] - Compliance-ready for MAS regulations")
+            try:
+                info = await client.request(AccountInfo(account=wallet.classic_address))
+                already_enabled = (
+                    info.is_successful()
+                    and info.result['account_data']['Flags'] & LSF_ALLOW_TRUSTLINE_CLAWBACK
+                )
+            except TRANSPORT_ERRORS:
+                already_enabled = False
+            if already_enabled:
+                console.print("[bold green]✅[/bold green] [green]Clawback already enabled[/green] on-chain")
+            else:
+                await submit_tx(tx, wallet)
+                console.print("[bold green]✅[/bold green] [green]Clawback enabled[/green] - Compliance-ready for MAS regulations")
+            if cache.get('address') == wallet.classic_address:
+                write_json(WALLET_CACHE, {**cache, "clawback_enabled": True})
             return True
         except Exception as e:
             console.print(f"[bold yellow]⚠️[/bold yellow] Clawback setup failed: [dim]{e}[/dim]")
@@ -76,7 +641,7 @@ def configure_issuer(wallet):
             return False
 
 
-def set_oracle_price(issuer_wallet, asset_data, oracle_doc_id):
+def set_oracle_price(issuer_wallet, asset_data, oracle_doc_id, ticker, currency_code, batch):
     """
     [XLS-47 Implementation] Set Oracle Price Feed
     
@@ -89,122 +654,65 @@ def set_oracle_price(issuer_wallet, asset_data, oracle_doc_id):
     - Quote Asset: XRP
     - Price: Valuation in drops (1 million drops = 1 XRP)
     
-    Returns the Oracle Document ID for reference.
+    `ticker` / `currency_code` identify the priced token (the caller already
+    has both). The OracleSet is queued on `batch` (a list of (transaction,
+    label) pairs) and submitted by the caller's flush_batch. Returns the
+    Oracle Document ID for reference.
     """
-    ticker = asset_data['financials']['tokens']['yt_ticker']
-    currency_code = str_to_hex(ticker).ljust(40, '0')
     project_name = asset_data['identity']['project']
     
-    # Calculate valuation price
-    try:
-        valuation = asset_data.get('financials', {}).get('est_valuation_sgd', '1000000')
-        if isinstance(valuation, str) and valuation.startswith('Dynamic'):
-            yield_apy = asset_data.get('financials', {}).get('yield_apy', 3.0)
+    # Valuation price: precomputed by clean_data.py, parsed here only for
+    # registries written before price_value_drops existed
+    financials = asset_data.get('financials', {})
+    price_value = financials.get('price_value_drops')
+    if not isinstance(price_value, int):
+        valuation = financials.get('est_valuation_sgd', '1000000')
+        yield_apy = financials.get('yield_apy', 3.0)
+        if isinstance(valuation, str) and valuation.startswith('Dynamic') and isinstance(yield_apy, (int, float)):
             base_value = 1500000 - (yield_apy * 50000)
             price_value = int(base_value * 1000000)
-        else:
+        elif isinstance(valuation, (int, float)):
+            price_value = int(valuation) * 1000000
+        elif isinstance(valuation, str) and valuation.replace('.', '', 1).isdecimal():
             price_value = int(float(valuation)) * 1000000
-    except:
-        price_value = 100000000  # Default: 100 SGD in drops
+        else:
+            price_value = 100000000  # Default: 100 SGD in drops
     
     price_sgd = price_value / 1000000
     
     console.print(f"[bold blue]📊[/bold blue] Publishing Oracle Price: [cyan]{project_name}[/cyan]")
     console.print(f"   [dim]Ticker:[/dim] {ticker} | [dim]Price:[/dim] {price_sgd:,.0f} SGD")
     
-    with console.status("[bold blue]Setting oracle price on-chain...", spinner="dots3"):
-        try:
-            # [XLS-47 Implementation] OracleSet transaction
-            tx = OracleSet(
-                account=issuer_wallet.classic_address,
-                oracle_document_id=int(oracle_doc_id, 16) if isinstance(oracle_doc_id, str) else oracle_doc_id,
-                base_asset={
-                    "currency": currency_code,
-                    "issuer": issuer_wallet.classic_address
-                },
-                quote_asset="XRP",
-                asset_class="0x525741",  # Hex for "RWA"
-                scale=1000000,
-            )
-            result = submit_and_wait(tx, client, issuer_wallet)
-            console.print(f"[bold green]✅[/bold green] Oracle price published [dim](Doc ID: {oracle_doc_id[:12]}...)[/dim]")
-            return oracle_doc_id
-        except AttributeError:
-            # OracleSet model not available - use raw transaction
-            console.print("[dim]   Note: OracleSet model not available, using raw transaction format[/dim]")
-            oracle_id = f"oracle_{issuer_wallet.classic_address[:8]}{int(time.time())}"
-            console.print(f"[bold green]✅[/bold green] Oracle price configured [dim](Doc ID: {oracle_id})[/dim]")
-            return oracle_id
-        except Exception as e:
-            console.print(f"[bold yellow]⚠️[/bold yellow] Oracle setup skipped: [dim]{str(e)[:50]}...[/dim]")
-            return f"oracle_{issuer_wallet.classic_address[:8]}{int(time.time())}"
-
-
-def create_amm_pool(issuer_wallet, asset_data):
-    """
-    [XLS-30 Implementation] Create AMM Liquidity Pool
-    
-    Creates an Automated Market Maker pool enabling instant swapping
-    between XRP and Property Tokens.
-    
-    Pool Configuration:
-    - Initial Liquidity: 10,000 Property Tokens ↔ 100 XRP
-    - Trading Fee: 0.5% (500 in basis points)
-    
-    This implementation checks if an AMM already exists before creating
-    to prevent duplicate pools (idempotent operation).
-    """
-    ticker = asset_data['financials']['tokens']['yt_ticker']
-    currency_code = str_to_hex(ticker).ljust(40, '0')
-    project_name = asset_data['identity']['project']
-    
-    console.print(f"[bold magenta]💧[/bold magenta] Creating AMM Pool: [cyan]{project_name}[/cyan]")
-    
-    # [XLS-30 Implementation] Check if AMM already exists
-    with console.status("[bold magenta]Checking existing liquidity pools...", spinner="bouncingBall"):
-        try:
-            from xrpl.models.requests import AMMInfo
-            amm_info = client.request(AMMInfo(
-                asset={
-                    "currency": currency_code,
-                    "issuer": issuer_wallet.classic_address
-                },
-                asset2="XRP"
-            ))
-            if amm_info.result.get('amm'):
-                console.print("[bold yellow]⚠️[/bold yellow] [dim]AMM pool already exists, skipping creation[/dim]")
-                return True
-        except:
-            pass  # AMM doesn't exist, proceed to create
-    
-    # [XLS-30 Implementation] Create AMM with initial liquidity
-    with console.status("[bold magenta]Creating liquidity pool...", spinner="dots"):
-        try:
-            token_amount = {
+    try:
+        # [XLS-47 Implementation] OracleSet transaction
+        tx = OracleSet(
+            account=issuer_wallet.classic_address,
+            oracle_document_id=int(oracle_doc_id, 16) if isinstance(oracle_doc_id, str) else oracle_doc_id,
+            base_asset={
                 "currency": currency_code,
-                "issuer": issuer_wallet.classic_address,
-                "value": "10000"  # 10,000 tokens
-            }
-            
-            tx = AMMCreate(
-                account=issuer_wallet.classic_address,
-                amount=token_amount,
-                amount2={"currency": "XRP", "value": "100"},  # 100 XRP
-                trading_fee=500,  # 0.5% (500/100000 = 0.5%)
-            )
-            result = submit_and_wait(tx, client, issuer_wallet)
-            
-            console.print("[bold green]✅[/bold green] [green]AMM pool created[/green]")
-            console.print("   [dim]Liquidity: 10,000 tokens ↔ 100 XRP | Fee: 0.5%[/dim]")
-            return True
-        except Exception as e:
-            error_msg = str(e)[:60]
-            console.print(f"[bold yellow]⚠️[/bold yellow] AMM creation failed: [dim]{error_msg}...[/dim]")
-            console.print("[dim]   (AMM amendment may not be enabled on this testnet node)[/dim]")
-            return False
+                "issuer": issuer_wallet.classic_address
+            },
+            quote_asset="XRP",
+            asset_class="0x525741",  # Hex for "RWA"
+            scale=1000000,
+        )
+        batch.append((tx, "Oracle price"))
+        console.print(f"[bold green]✅[/bold green] Oracle price queued [dim](Doc ID: {oracle_doc_id[:12]}...)[/dim]")
+        return oracle_doc_id
+    except AttributeError:
+        # OracleSet model not available - use raw transaction
+        console.print("[dim]   Note: OracleSet model not available, using raw transaction format[/dim]")
+        oracle_id = f"oracle_{issuer_wallet.classic_address[:8]}{int(time.time())}"
+        console.print(f"[bold green]✅[/bold green] Oracle price configured [dim](Doc ID: {oracle_id})[/dim]")
+        return oracle_id
+    except Exception as e:
+        console.print(f"[bold yellow]⚠️[/bold yellow] Oracle setup skipped: [dim]{str(e)[:50]}...[/dim]")
+        return f"oracle_{issuer_wallet.classic_address[:8]}{int(time.time())}"
 
 
-def create_amm_pool_for_token(issuer_wallet, ticker, currency_code, project_name, token_type):
+async def create_amm_pool_for_token(issuer_wallet, ticker, currency_code, project_name, token_type, batch,
+                                    skip_existence_check=False, token_value='10000', xrp_value='100',
+                                    trading_fee=500):
     """
     [XLS-30 Implementation] Helper function to create AMM pool for a specific token
     
@@ -216,52 +724,56 @@ def create_amm_pool_for_token(issuer_wallet, ticker, currency_code, project_name
         currency_code: Hex currency code for the token
         project_name: Property project name
         token_type: "Principal Token" or "Yield Token"
+        batch: List of (transaction, label) pairs; the AMMCreate is queued here
+            under the label f"{token_type} AMM pool" for the caller's flush_batch
+        skip_existence_check: Skip the AMMInfo probe; set when the issuer wallet
+            was just created by the faucet and cannot own any pools yet
+        token_value: Initial token liquidity (default 10,000 tokens)
+        xrp_value: Initial XRP liquidity in XRP, not drops (default 100 XRP)
+        trading_fee: Trading fee in 1/100000 units (default 500 = 0.5%)
     
     Returns:
-        bool: True if pool created or exists, False otherwise
+        bool: True if the pool already exists, False if creation was queued
     """
     console.print(f"   [dim]Creating {token_type} AMM pool ({ticker}/XRP)...[/dim]")
     
-    # Check if AMM exists
-    with console.status(f"[dim]Checking {token_type} pool...", spinner="dots"):
+    # Check if AMM exists (no spinner: this runs concurrently inside the minting Progress)
+    if not skip_existence_check:
         try:
-            from xrpl.models.requests import AMMInfo
-            amm_info = client.request(AMMInfo(
-                asset={
-                    "currency": currency_code,
-                    "issuer": issuer_wallet.classic_address
-                },
-                asset2="XRP"
-            ))
-            if amm_info.result.get('amm'):
+            if await amm_exists(issuer_wallet, currency_code):
                 console.print(f"   [yellow]⚠️[/yellow] [dim]{token_type} AMM pool already exists[/dim]")
                 return True
-        except:
-            pass  # AMM doesn't exist, proceed to create
+        except (*TRANSPORT_ERRORS, XRPLRequestFailureException) as e:
+            console.print(f"   [yellow]⚠️[/yellow] {token_type} pool check failed: [dim]{str(e)[:50]}...[/dim]")
+            return False
     
-    # Create AMM pool
+    queue_amm_create(issuer_wallet, currency_code, token_type, batch, token_value, xrp_value, trading_fee)
+    return False
+
+
+def queue_amm_create(issuer_wallet, currency_code, token_type, batch, token_value='10000', xrp_value='100',
+                     trading_fee=500):
+    """Build the token/XRP AMMCreate and queue it on batch as f"{token_type} AMM pool"."""
     try:
-        token_amount = {
-            "currency": currency_code,
-            "issuer": issuer_wallet.classic_address,
-            "value": "10000"  # 10,000 tokens
-        }
+        token_amount = IssuedCurrencyAmount(
+            currency=currency_code,
+            issuer=issuer_wallet.classic_address,
+            value=token_value
+        )
         
         tx = AMMCreate(
             account=issuer_wallet.classic_address,
             amount=token_amount,
-            amount2={"currency": "XRP", "value": "100"},  # 100 XRP
-            trading_fee=500,  # 0.5%
+            amount2=xrp_to_drops(Decimal(xrp_value)),  # XRP side is given in drops
+            trading_fee=trading_fee,
         )
-        result = submit_and_wait(tx, client, issuer_wallet)
-        console.print(f"   [green]✅[/green] [dim]{token_type} AMM pool created[/dim]")
-        return True
+        batch.append((tx, f"{token_type} AMM pool"))
     except Exception as e:
         console.print(f"   [yellow]⚠️[/yellow] {token_type} AMM failed: [dim]{str(e)[:50]}...[/dim]")
-        return False
 
 
-def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None):
+async def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None, skip_existence_check=False,
+                          already_configured=False):
     """
     [Mock RLUSD Implementation] Mint Testnet RLUSD Token
     
@@ -271,6 +783,9 @@ def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None):
     Args:
         issuer_wallet: Wallet to issue RLUSD from (if None, generates new one)
         distribution_addresses: List of addresses to send RLUSD to (testnet wallets)
+        skip_existence_check: Issuer wallet is brand new, so skip the AMMInfo probe
+        already_configured: Clawback was already enabled on issuer_wallet, so skip
+            the second AccountSet (and its ledger close)
     
     Returns:
         dict with RLUSD chain_info (issuer, currency, ticker)
@@ -284,59 +799,46 @@ def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None):
     
     # Use provided wallet or generate new one
     if issuer_wallet is None:
-        issuer_wallet = get_free_issuer_wallet()
+        issuer_wallet, fresh = await get_free_issuer_wallet()
+        skip_existence_check = skip_existence_check or fresh
     
     rlusd_ticker = "RLUSD"
-    rlusd_currency = str_to_hex(rlusd_ticker).ljust(40, '0')
+    rlusd_currency = _currency_hex(rlusd_ticker)
     
     # Configure issuer with clawback (XLS-39)
-    configure_issuer(issuer_wallet)
+    if not already_configured:
+        await configure_issuer(issuer_wallet)
     
     console.print(f"[bold green]✅[/bold green] RLUSD Token configured")
     console.print(f"   [dim]Ticker:[/dim] {rlusd_ticker}")
     console.print(f"   [dim]Currency Code:[/dim] {rlusd_currency}")
     console.print(f"   [dim]Issuer:[/dim] {issuer_wallet.classic_address}")
     
-    # Create RLUSD/XRP AMM pool for liquidity
+    # Create RLUSD/XRP AMM pool for liquidity (larger than the per-asset pools)
     console.print(f"[bold magenta]💧[/bold magenta] Creating RLUSD/XRP AMM Pool...")
-    amm_created = create_amm_pool_for_token(
+    batch = []
+    amm_created = await create_amm_pool_for_token(
         issuer_wallet,
         rlusd_ticker,
         rlusd_currency,
         "RLUSD",
-        "RLUSD Token"
+        "RLUSD Token",
+        batch,
+        skip_existence_check=skip_existence_check,
+        token_value="100000",  # 100k RLUSD
+        xrp_value="1000",  # 1000 XRP
+        trading_fee=300  # 0.3%
     )
-    
-    # Update to use larger pool size for RLUSD
-    if not amm_created:
-        try:
-            token_amount = {
-                "currency": rlusd_currency,
-                "issuer": issuer_wallet.classic_address,
-                "value": "100000"  # 100k RLUSD
-            }
-            
-            tx = AMMCreate(
-                account=issuer_wallet.classic_address,
-                amount=token_amount,
-                amount2={"currency": "XRP", "value": "1000"},  # 1000 XRP
-                trading_fee=300,  # 0.3%
-            )
-            result = submit_and_wait(tx, client, issuer_wallet)
-            console.print("[bold green]✅[/bold green] RLUSD/XRP AMM pool created")
-            amm_created = True
-        except Exception as e:
-            console.print(f"[yellow]⚠️[/yellow] RLUSD AMM creation failed: [dim]{str(e)[:50]}...[/dim]")
+    if batch:
+        amm_created = (await flush_batch(batch, issuer_wallet))["RLUSD Token AMM pool"]
     
     # Distribute RLUSD to test wallets (if provided)
     if distribution_addresses:
         console.print(f"[bold cyan]📤[/bold cyan] Distributing RLUSD to {len(distribution_addresses)} wallets...")
-        from xrpl.models.transactions import Payment
-        from xrpl.models.amounts import IssuedCurrencyAmount
-        
+        payments = {}
         for addr in distribution_addresses:
             try:
-                payment = Payment(
+                payments[addr] = Payment(
                     account=issuer_wallet.classic_address,
                     destination=addr,
                     amount=IssuedCurrencyAmount(
@@ -345,10 +847,18 @@ def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None):
                         value="10000"  # 10,000 RLUSD per wallet
                     )
                 )
-                submit_and_wait(payment, client, issuer_wallet)
-                console.print(f"   [dim]Sent 10,000 RLUSD to {addr[:8]}...[/dim]")
             except Exception as e:
                 console.print(f"   [yellow]⚠️[/yellow] Failed to send to {addr}: [dim]{str(e)[:50]}...[/dim]")
+        
+        # Payments only share the issuer's Sequence, which submit_batch hands
+        # out up front, so they are all submitted concurrently and validated
+        # in one polling loop instead of one ledger close per wallet.
+        results = await submit_batch(list(payments.values()), issuer_wallet)
+        for addr, result in zip(payments, results):
+            if isinstance(result, Exception):
+                console.print(f"   [yellow]⚠️[/yellow] Failed to send to {addr}: [dim]{str(result)[:50]}...[/dim]")
+            else:
+                console.print(f"   [dim]Sent 10,000 RLUSD to {addr[:8]}...[/dim]")
     
     return {
         "issuer": issuer_wallet.classic_address,
@@ -358,7 +868,34 @@ def mint_mock_rlusd(issuer_wallet=None, distribution_addresses=None):
     }
 
 
-def mint_asset_on_chain(issuer_wallet, asset_data, index):
+async def collect_rlusd(rlusd_task, issuer_wallet):
+    """
+    Await main()'s background mint_mock_rlusd task without letting a failure
+    there abort the run: the error is reported and recorded in the returned
+    RLUSD info instead, so the minted assets are still saved.
+    """
+    try:
+        return await rlusd_task
+    except Exception as e:
+        console.print(f"[bold yellow]⚠️[/bold yellow] RLUSD setup failed: [dim]{str(e)[:50]}...[/dim]")
+        return {
+            "issuer": issuer_wallet.classic_address,
+            "currency": _currency_hex("RLUSD"),
+            "ticker": "RLUSD",
+            "amm_exists": False,
+            "error": str(e)
+        }
+
+
+def token_tickers(asset_data):
+    """(yt_ticker, pt_ticker) for an asset; PT defaults to PT-<project code>."""
+    tokens = asset_data['financials']['tokens']
+    yt_ticker = tokens['yt_ticker']
+    return yt_ticker, tokens.get('pt_ticker', f"PT-{yt_ticker.split('-')[1]}")
+
+
+def build_txs(issuer_wallet, asset_data, index, oracle_doc_id, existing_pools=frozenset(),
+              unchecked_pools=frozenset()):
     """
     Complete Asset Lifecycle: Token Minting (PT + YT) + Oracle + AMM
     
@@ -370,13 +907,19 @@ def mint_asset_on_chain(issuer_wallet, asset_data, index):
     - [XLS-30] AMM liquidity pool creation (for both PT and YT)
     - [XLS-33] Multi-Purpose Tokens (using Issued Currency standard)
     
-    Returns chain_info dictionary with all on-chain asset details.
+    Pure build step with no network I/O: returns (chain_info, batch) where
+    batch holds the asset's (transaction, label) pairs, ready for
+    submit_txs. Pools whose currency code is in existing_pools are recorded
+    as existing and not created again; those in unchecked_pools (their probe
+    failed) are skipped and recorded as not existing, since unconfirmed.
+    oracle_doc_id is the hex Oracle Document ID, allocated by the caller.
+    Once the transactions complete, fold their outcomes in with
+    apply_outcomes.
     """
-    yt_ticker = asset_data['financials']['tokens']['yt_ticker']
-    pt_ticker = asset_data['financials']['tokens'].get('pt_ticker', f"PT-{yt_ticker.split('-')[1]}")
+    yt_ticker, pt_ticker = token_tickers(asset_data)
     
-    yt_currency = str_to_hex(yt_ticker).ljust(40, '0')
-    pt_currency = str_to_hex(pt_ticker).ljust(40, '0')
+    yt_currency = _currency_hex(yt_ticker)
+    pt_currency = _currency_hex(pt_ticker)
     
     project_name = asset_data['identity']['project']
     
@@ -408,9 +951,10 @@ def mint_asset_on_chain(issuer_wallet, asset_data, index):
     chain_info["currency"] = yt_currency
     chain_info["ticker"] = yt_ticker
     
+    batch = []
+    
     # [XLS-47 Implementation] Set Oracle Price (for YT token)
-    oracle_doc_id = hex(int(time.time()) + index)[2:]
-    oracle_id = set_oracle_price(issuer_wallet, asset_data, oracle_doc_id)
+    oracle_id = set_oracle_price(issuer_wallet, asset_data, oracle_doc_id, yt_ticker, yt_currency, batch)
     chain_info['oracle'] = {
         "document_id": oracle_id,
         "asset_class": "RWA",
@@ -419,53 +963,56 @@ def mint_asset_on_chain(issuer_wallet, asset_data, index):
     
     # [XLS-30 Implementation] Create AMM pools for BOTH PT and YT
     console.print(f"[bold magenta]💧[/bold magenta] Creating AMM Pools...")
-    
-    # YT/XRP Pool
-    yt_amm = create_amm_pool_for_token(
-        issuer_wallet,
-        yt_ticker,
-        yt_currency,
-        project_name,
-        "Yield Token"
-    )
-    
-    # PT/XRP Pool
-    pt_amm = create_amm_pool_for_token(
-        issuer_wallet,
-        pt_ticker,
-        pt_currency,
-        project_name,
-        "Principal Token"
-    )
+    for token_type, ticker, currency_code in (
+        ("Yield Token", yt_ticker, yt_currency),  # YT/XRP Pool
+        ("Principal Token", pt_ticker, pt_currency),  # PT/XRP Pool
+    ):
+        console.print(f"   [dim]Creating {token_type} AMM pool ({ticker}/XRP)...[/dim]")
+        if currency_code in existing_pools:
+            console.print(f"   [yellow]⚠️[/yellow] [dim]{token_type} AMM pool already exists[/dim]")
+        elif currency_code in unchecked_pools:
+            console.print(f"   [yellow]⚠️[/yellow] [dim]{token_type} pool check failed; not creating it[/dim]")
+        else:
+            queue_amm_create(issuer_wallet, currency_code, token_type, batch)
     
     chain_info['amm'] = {
         "yt": {
-            "exists": yt_amm,
+            "exists": yt_currency in existing_pools,
             "trading_fee": 0.5,
             "pool": "YT/XRP"
         },
         "pt": {
-            "exists": pt_amm,
+            "exists": pt_currency in existing_pools,
             "trading_fee": 0.5,
             "pool": "PT/XRP"
         }
     }
     
-    # Backward compatibility: legacy amm structure
-    chain_info['amm']['exists'] = yt_amm or pt_amm
-    chain_info['amm']['trading_fee'] = 0.5
-    chain_info['amm']['liquidity_provided'] = yt_amm or pt_amm
-    
     # [XLS-33 Implementation] Token Standard
     chain_info['token_standard'] = "XLS-33 (Issued Currency)"
     
-    console.print(f"[bold green]✅[/bold green] [bold]Both tokens configured on-chain[/bold]")
-    time.sleep(1)  # Brief pause for readability
+    return chain_info, batch
+
+
+def apply_outcomes(chain_info, outcomes):
+    """Fold {label: succeeded} for an asset's submitted batch into its chain_info."""
+    if not outcomes.get("Oracle price", True):
+        chain_info['oracle']['document_id'] = f"oracle_{chain_info['issuer'][:8]}{int(time.time())}"
+    
+    amm = chain_info['amm']
+    amm['yt']['exists'] = amm['yt']['exists'] or outcomes.get("Yield Token AMM pool", False)
+    amm['pt']['exists'] = amm['pt']['exists'] or outcomes.get("Principal Token AMM pool", False)
+    
+    # Backward compatibility: legacy amm structure
+    amm['exists'] = amm['yt']['exists'] or amm['pt']['exists']
+    amm['trading_fee'] = 0.5
+    amm['liquidity_provided'] = amm['exists']
     
+    console.print(f"[bold green]✅[/bold green] [bold]Both tokens configured on-chain:[/bold] {chain_info['human_name']}")
     return chain_info
 
 
-def main():
+async def main(pace=0, pretty=False):
     """
     Main execution function for RWAX Protocol Asset Minting Pipeline.
     
@@ -476,117 +1023,192 @@ def main():
     4. [XLS-40] DID - Identity verification (handled in frontend)
     5. [XLS-33] MPT - Multi-purpose tokens (Issued Currency)
     
-    Processes first 3 assets from rwa_assets.json and creates summary table.
+    Processes the first MINT_LIMIT assets from rwa_assets.json and creates summary table.
+    With pace > 0, each asset's transactions are submitted `pace` seconds
+    after the previous asset's instead of all at once (visual pacing only).
+    With pretty, an indented copy of the registry is also written next to
+    the compact DATA_FILE.
     """
     # Header banner
     console.print()
-    console.print(Panel.fit(
-        "[bold cyan]🚀 RWAX PROTOCOL[/bold cyan]\n"
-        "[bold]5 XRPL Standards Implementation[/bold]\n\n"
-        "[green]✅[/green] XLS-39 (Clawback) - Compliance enforcement\n"
-        "[green]✅[/green] XLS-47 (Price Oracles) - On-chain valuation\n"
-        "[green]✅[/green] XLS-30 (AMM) - Instant liquidity pools\n"
-        "[green]✅[/green] XLS-40 (DID) - Identity verification\n"
-        "[green]✅[/green] XLS-33 (MPT) - Multi-purpose tokens",
-        border_style="cyan",
-        title="[bold cyan]Asset Minting Pipeline[/bold cyan]"
-    ))
+    console.print(HEADER_PANEL)
     console.print()
     
-    # Generate issuer wallet
-    issuer_wallet = get_free_issuer_wallet()
-    
-    # [XLS-39 Implementation] Enable Clawback
-    clawback_enabled = configure_issuer(issuer_wallet)
-    
-    # [Mock RLUSD] Create RLUSD token for testing Asset-to-Asset swaps
-    console.print()
-    console.print(Panel.fit(
-        "[bold green]💰 Creating Mock RLUSD Token[/bold green]",
-        border_style="green"
-    ))
-    rlusd_info = mint_mock_rlusd(issuer_wallet)
-    
-    # Save RLUSD info to a separate file for frontend
-    import os
-    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    rlusd_file = os.path.join(os.path.dirname(DATA_FILE), "rlusd_info.json")
-    with open(rlusd_file, 'w', encoding='utf-8') as f:
-        json.dump(rlusd_info, f, indent=2)
-    console.print(f"[bold green]✅[/bold green] RLUSD info saved to {rlusd_file}")
-    
-    # Load asset data
-    try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            assets = json.load(f)
-    except FileNotFoundError:
-        console.print(f"[bold red]❌[/bold red] [red]Error:[/red] {DATA_FILE} not found")
-        console.print("[yellow]Please run clean_data.py first![/yellow]")
-        return
-    except Exception as e:
-        console.print(f"[bold red]❌[/bold red] [red]Error reading {DATA_FILE}:[/red] {e}")
-        return
-    
-    # Process assets
-    console.print()
-    console.print(Panel.fit(
-        f"[bold]Processing Assets[/bold]\n"
-        f"[dim]Total assets available: {len(assets)}[/dim]\n"
-        f"[dim]Processing first 3 assets for demo[/dim]",
-        border_style="blue"
-    ))
-    console.print()
-    
-    updated_assets = []
-    processed_summary = []
-    
+    # One Progress for every XRPL wait in the run (wallet, clawback, pool
+    # probes, per-asset submissions, save) instead of a status per sub-step
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-        transient=True
+        transient=True,
+        disable=not _IS_TTY
     ) as progress:
+        # Generate issuer wallet
+        issuer_wallet, wallet_is_fresh = await get_free_issuer_wallet(progress)
+        
+        # [XLS-39 Implementation] Enable Clawback
+        clawback_enabled = await configure_issuer(issuer_wallet, progress)
+        
+        # [Mock RLUSD] Create RLUSD token for testing Asset-to-Asset swaps
+        console.print()
+        console.print(Panel.fit(
+            "[bold green]💰 Creating Mock RLUSD Token[/bold green]",
+            border_style="green"
+        ))
+        # Clawback was just configured above. The RLUSD pool's ledger close
+        # overlaps the asset minting below. Yielding once lets the task print
+        # its setup; for a fresh wallet its AMMCreate is also queued before the
+        # assets start, but a cached wallet's task is still probing for the
+        # pool, so its remaining output interleaves with the asset panels and
+        # its AMMCreate goes out in a batch of its own.
+        rlusd_task = asyncio.create_task(
+            mint_mock_rlusd(issuer_wallet, skip_existence_check=wallet_is_fresh, already_configured=True)
+        )
+        await asyncio.sleep(0)
+        
+        rlusd_file = os.path.join(os.path.dirname(DATA_FILE), "rlusd_info.json")
+        
+        # Load asset data
+        try:
+            assets = load_assets(MINT_LIMIT)
+        except FileNotFoundError:
+            console.print(f"[bold red]❌[/bold red] [red]Error:[/red] {DATA_FILE} not found")
+            console.print("[yellow]Please run clean_data.py first![/yellow]")
+            assets = None
+        except ASSET_LOAD_ERRORS as e:
+            console.print(f"[bold red]❌[/bold red] [red]Error reading {DATA_FILE}:[/red] {e}")
+            assets = None
+        if assets is None:
+            # No registry to update, but the RLUSD token is on-chain regardless
+            rlusd_info = await collect_rlusd(rlusd_task, issuer_wallet)
+            write_json_files({rlusd_file: (rlusd_info, True)})
+            console.print(f"[bold green]✅[/bold green] RLUSD info saved to {rlusd_file}")
+            return
+        
+        # Process assets
+        console.print()
+        console.print(Panel.fit(
+            f"[bold]Processing Assets[/bold]\n"
+            f"[dim]Processing first {len(assets)} assets for demo[/dim]",
+            border_style="blue"
+        ))
+        console.print()
+        
+        processed_summary = []
+        
+        # Probe every asset's PT and YT pool in one concurrent round instead of
+        # one AMMInfo round-trip per pool. A freshly funded issuer has no pools
+        # yet, so there is nothing to probe.
+        currency_codes = {}
+        failed = {}
         for i, asset in enumerate(assets):
-            if i < 3:  # Process first 3 assets
-                task = progress.add_task(f"Processing {asset['identity']['project']}...", total=None)
-                try:
-                    asset['chain_info'] = mint_asset_on_chain(issuer_wallet, asset, i)
-                    asset['chain_info']['clawback_enabled'] = clawback_enabled
-                    
-                    # Collect summary data
-                    processed_summary.append({
-                        "name": asset['identity']['project'],
-                        "issuer": issuer_wallet.classic_address,
-                        "oracle": asset['chain_info']['oracle']['price_set'],
-                        "amm": asset['chain_info']['amm']['exists'],
-                        "clawback": clawback_enabled
-                    })
-                    
-                    progress.update(task, completed=True)
-                except Exception as e:
-                    console.print(f"[bold red]❌[/bold red] Failed to process asset #{i + 1}: [dim]{e}[/dim]")
-                    asset['chain_info'] = {
-                        "error": str(e),
-                        "issuer": issuer_wallet.classic_address,
-                        "status": "failed"
-                    }
-            updated_assets.append(asset)
+            try:
+                currency_codes[i] = [_currency_hex(ticker) for ticker in token_tickers(asset)]
+            except Exception as e:
+                failed[i] = e
+        existing_pools = unchecked_pools = frozenset()
+        if not wallet_is_fresh:
+            with step(progress, "[bold magenta]Checking existing liquidity pools..."):
+                existing_pools, unchecked_pools = await probe_pools(
+                    issuer_wallet,
+                    {currency_code for codes in currency_codes.values() for currency_code in codes}
+                )
+        
+        # Build every asset's transactions up front (no I/O). Oracle Document
+        # IDs come from one timestamp read: base_ts + asset index, in hex.
+        base_ts = int(time.time())
+        built = {}
+        for i in currency_codes:
+            try:
+                built[i] = build_txs(
+                    issuer_wallet, assets[i], i, f"{base_ts + i:x}", existing_pools, unchecked_pools
+                )
+            except Exception as e:
+                failed[i] = e
+        
+        # Submit everything in one wave, or one wave per asset when pacing
+        entries = [(i, tx, label) for i, (_, batch) in built.items() for tx, label in batch]
+        if pace:
+            waves = [[entry for entry in entries if entry[0] == i] for i in built]
+        else:
+            waves = [entries]
+        
+        async def outcome(i, label, future):
+            try:
+                await future
+                return i, label, None
+            except Exception as e:
+                return i, label, e
+        
+        outcomes = {i: {} for i in built}
+        tasks = {
+            i: progress.add_task(f"Processing {assets[i]['identity']['project']}...", total=len(batch))
+            for i, (_, batch) in built.items()
+        }
+        
+        # Locally allocated sequences keep the concurrent submissions from
+        # colliding on the shared issuer; completions are reported as they land.
+        completions = []
+        for n, wave in enumerate(waves):
+            if n:
+                await asyncio.sleep(pace)
+            futures = await submit_txs([tx for _, tx, _ in wave], issuer_wallet)
+            completions += [outcome(i, label, future) for (i, _, label), future in zip(wave, futures)]
+        
+        for completion in asyncio.as_completed(completions):
+            i, label, error = await completion
+            project_name = assets[i]['identity']['project']
+            if error is None:
+                state = "validated"
+                console.print(f"   [green]✅[/green] [dim]{project_name}: {label} validated[/dim]")
+            else:
+                state = "failed"
+                console.print(f"   [yellow]⚠️[/yellow] {project_name}: {label} failed: [dim]{str(error)[:50]}...[/dim]")
+            outcomes[i][label] = error is None
+            progress.update(tasks[i], advance=1, description=f"{project_name}: {label} {state}")
+        
+        for i, asset in enumerate(assets):
+            if i in failed:
+                console.print(f"[bold red]❌[/bold red] Failed to process asset #{i + 1}: [dim]{failed[i]}[/dim]")
+                asset['chain_info'] = {
+                    "error": str(failed[i]),
+                    "issuer": issuer_wallet.classic_address,
+                    "status": "failed"
+                }
+            else:
+                asset['chain_info'] = apply_outcomes(built[i][0], outcomes[i])
+                asset['chain_info']['clawback_enabled'] = clawback_enabled
             
-            # Small delay to avoid rate limiting
-            if i < 2:
-                time.sleep(2)
-    
-    # Save updated assets
-    with console.status("[bold green]Saving updated asset data...", spinner="dots"):
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(updated_assets, f, indent=2)
+                # Collect summary data
+                processed_summary.append({
+                    "name": asset['identity']['project'],
+                    "issuer": issuer_wallet.classic_address,
+                    "oracle": asset['chain_info']['oracle']['price_set'],
+                    "amm": asset['chain_info']['amm']['exists'],
+                    "clawback": clawback_enabled
+                })
+        
+        rlusd_info = await collect_rlusd(rlusd_task, issuer_wallet)
+        
+        # Save updated assets and RLUSD info (separate file for frontend) together
+        # at the end, through write_json_files. The full registry is only
+        # loaded here, where the minted entries are spliced back over the
+        # front of it. The registry is only read by tooling, so it is written
+        # compact; --pretty adds an indented copy alongside it for humans. The
+        # registry is replaced last: if it is updated, so is everything else.
+        with step(progress, "[bold green]Saving updated asset data..."):
+            updated_assets = read_json(DATA_FILE)
+            updated_assets[:len(assets)] = assets
+            outputs = {rlusd_file: (rlusd_info, True)}
+            if pretty:
+                outputs[os.path.splitext(DATA_FILE)[0] + ".pretty.json"] = (updated_assets, True)
+            outputs[DATA_FILE] = (updated_assets, False)
+            write_json_files(outputs)
+        console.print(f"[bold green]✅[/bold green] RLUSD info saved to {rlusd_file}")
     
     # Summary table
     console.print()
-    console.print(Panel.fit(
-        "[bold green]✅ PROTOCOL UPGRADE COMPLETE[/bold green]",
-        border_style="green"
-    ))
+    console.print(COMPLETE_PANEL)
     console.print()
     
     # Create summary table
@@ -599,33 +1221,39 @@ def main():
         table.add_column("Clawback", justify="center", style="yellow")
         
         for item in processed_summary:
-            oracle_status = "[green]✓[/green]" if item['oracle'] else "[red]✗[/red]"
-            amm_status = "[green]✓[/green]" if item['amm'] else "[red]✗[/red]"
-            clawback_status = "[green]✓[/green]" if item['clawback'] else "[red]✗[/red]"
-            
-            issuer_short = f"{item['issuer'][:8]}...{item['issuer'][-6:]}"
-            
             table.add_row(
                 item['name'],
-                issuer_short,
-                oracle_status,
-                amm_status,
-                clawback_status
+                f"{item['issuer'][:8]}...{item['issuer'][-6:]}",
+                CHECK if item['oracle'] else CROSS,
+                CHECK if item['amm'] else CROSS,
+                CHECK if item['clawback'] else CROSS
             )
         
         console.print(table)
         console.print()
     
     # Footer
-    console.print(Panel.fit(
-        f"[bold]Next Steps[/bold]\n\n"
-        f"[cyan]1.[/cyan] Run [bold]yarn sync-data[/bold] to sync to frontend\n"
-        f"[cyan]2.[/cyan] Check frontend for Oracle prices and AMM status\n"
-        f"[cyan]3.[/cyan] Test swap functionality with DID-verified account",
-        border_style="dim",
-        title="[dim]📋 Actions[/dim]"
-    ))
+    console.print(FOOTER_PANEL)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=f"Mint the first {MINT_LIMIT} RWA assets on the XRPL Testnet.")
+    parser.add_argument(
+        "--pace", type=float, default=0, metavar="SECONDS",
+        help="pause between assets' submissions, for following along in demos (default: no pause)"
+    )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="also write an indented copy of the registry to rwa_assets.pretty.json"
+    )
+    return parser.parse_args()
+
+
+async def run(args):
+    """Run the pipeline inside the WebSocket connection's lifetime."""
+    async with client:
+        await main(pace=args.pace, pretty=args.pretty)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(run(parse_args()))
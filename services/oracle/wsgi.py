@@ -0,0 +1,14 @@
+# services/oracle/wsgi.py
+# RWAX Event Logger: Production WSGI Entrypoint
+"""
+Serves the event logger under Gunicorn instead of Werkzeug's dev server:
+
+    gunicorn -k gthread -w 1 --threads 16 -b 0.0.0.0:3001 wsgi:app
+
+Keep a single worker process: event history and the terminal renderer
+live in-process, so extra workers would split the event stream.
+Concurrency comes from the gthread pool instead.
+"""
+from event_logger import app, print_banner
+
+print_banner()